@@ -1,7 +1,7 @@
 """Robust idempotent migration script to ensure required columns and indexes exist.
 
-This script checks information_schema/pg_indexes and only applies ALTER/CREATE INDEX
-when necessary, logging the exact changes applied.
+Every statement is guarded with IF NOT EXISTS, so the whole migration is sent to
+the server as a single multi-statement batch and is safe to re-run.
 """
 import logging
 from db_schema import get_db_connection
@@ -9,18 +9,32 @@ from db_schema import get_db_connection
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-
-def _column_exists(cur, table_name: str, column_name: str) -> bool:
-    cur.execute(
-        "SELECT 1 FROM information_schema.columns WHERE table_name = %s AND column_name = %s",
-        (table_name, column_name),
-    )
-    return cur.fetchone() is not None
-
-
-def _index_exists(cur, index_name: str) -> bool:
-    cur.execute("SELECT 1 FROM pg_indexes WHERE indexname = %s", (index_name,))
-    return cur.fetchone() is not None
+MIGRATION_STATEMENTS = (
+    "ALTER TABLE contributors ADD COLUMN IF NOT EXISTS contributor_hash BYTEA",
+    "ALTER TABLE contributions ADD COLUMN IF NOT EXISTS contribution_hash BYTEA",
+    "CREATE UNIQUE INDEX IF NOT EXISTS contributors_contributor_hash_idx ON contributors(contributor_hash)",
+    "CREATE UNIQUE INDEX IF NOT EXISTS contributions_contribution_hash_idx ON contributions(contribution_hash)",
+    # Let the ETL defer foreign key checks to COMMIT (re-running is a no-op)
+    "ALTER TABLE contributions ALTER CONSTRAINT contributions_committee_id_fkey DEFERRABLE",
+    "ALTER TABLE contributions ALTER CONSTRAINT contributions_contributor_id_fkey DEFERRABLE",
+    "ALTER TABLE candidate_committees ALTER CONSTRAINT candidate_committees_candidate_id_fkey DEFERRABLE",
+    "ALTER TABLE candidate_committees ALTER CONSTRAINT candidate_committees_committee_id_fkey DEFERRABLE",
+    # contributor_hash is the dedup key; the wide composite UNIQUE duplicated it
+    "ALTER TABLE contributors DROP CONSTRAINT IF EXISTS contributors_name_city_state_zip_code_occupation_employer_key",
+    # Hashes used to be stored as 64-char hex strings; store the raw 32-byte digests instead
+    """DO $$
+    BEGIN
+        IF (SELECT data_type FROM information_schema.columns
+            WHERE table_name = 'contributors' AND column_name = 'contributor_hash') <> 'bytea' THEN
+            ALTER TABLE contributors ALTER COLUMN contributor_hash TYPE BYTEA USING decode(contributor_hash, 'hex');
+        END IF;
+        IF (SELECT data_type FROM information_schema.columns
+            WHERE table_name = 'contributions' AND column_name = 'contribution_hash') <> 'bytea' THEN
+            ALTER TABLE contributions ALTER COLUMN contribution_hash TYPE BYTEA USING decode(contribution_hash, 'hex');
+        END IF;
+    END
+    $$""",
+)
 
 
 def run_migrations():
@@ -29,32 +43,10 @@ def run_migrations():
         conn = get_db_connection()
         with conn:
             with conn.cursor() as cur:
-                # contributors.contributor_hash
-                if not _column_exists(cur, 'contributors', 'contributor_hash'):
-                    logger.info("Adding column contributors.contributor_hash")
-                    cur.execute("ALTER TABLE contributors ADD COLUMN contributor_hash VARCHAR(64);")
-                else:
-                    logger.info("Column contributors.contributor_hash already exists")
-
-                # contributions.contribution_hash
-                if not _column_exists(cur, 'contributions', 'contribution_hash'):
-                    logger.info("Adding column contributions.contribution_hash")
-                    cur.execute("ALTER TABLE contributions ADD COLUMN contribution_hash VARCHAR(64);")
-                else:
-                    logger.info("Column contributions.contribution_hash already exists")
-
-                # indexes
-                if not _index_exists(cur, 'contributors_contributor_hash_idx'):
-                    logger.info("Creating index contributors_contributor_hash_idx")
-                    cur.execute("CREATE UNIQUE INDEX contributors_contributor_hash_idx ON contributors(contributor_hash);")
-                else:
-                    logger.info("Index contributors_contributor_hash_idx already exists")
-
-                if not _index_exists(cur, 'contributions_contribution_hash_idx'):
-                    logger.info("Creating index contributions_contribution_hash_idx")
-                    cur.execute("CREATE UNIQUE INDEX contributions_contribution_hash_idx ON contributions(contribution_hash);")
-                else:
-                    logger.info("Index contributions_contribution_hash_idx already exists")
+                for statement in MIGRATION_STATEMENTS:
+                    logger.info("Applying: %s", statement)
+                # One round-trip for the whole batch
+                cur.execute(";\n".join(MIGRATION_STATEMENTS) + ";")
 
         logger.info("Migrations applied successfully")
     except Exception:
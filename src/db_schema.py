@@ -1,9 +1,9 @@
 
 import os
 import logging
-import os
-import logging
+import threading
 import psycopg2
+from psycopg2 import pool
 from dotenv import load_dotenv
 
 # Configure logging
@@ -18,6 +18,9 @@ DB_PASSWORD = os.getenv("DB_PASSWORD")
 DB_HOST = os.getenv("DB_HOST")
 DB_PORT = os.getenv("DB_PORT")
 
+_POOL = None
+_POOL_LOCK = threading.Lock()
+
 
 def get_db_connection():
     """Establishes and returns a connection to the PostgreSQL database."""
@@ -36,6 +39,28 @@ def get_db_connection():
         raise
 
 
+def get_connection_pool(minconn: int = 1, maxconn: int = 8):
+    """Returns the process-wide connection pool, creating it on first use."""
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            try:
+                _POOL = pool.ThreadedConnectionPool(
+                    minconn,
+                    maxconn,
+                    dbname=DB_NAME,
+                    user=DB_USER,
+                    password=DB_PASSWORD,
+                    host=DB_HOST,
+                    port=DB_PORT,
+                )
+                logging.info("Database connection pool created (max %d connections).", maxconn)
+            except psycopg2.OperationalError as e:
+                logging.error(f"Could not connect to the database: {e}")
+                raise
+        return _POOL
+
+
 def create_tables():
     """Create tables in the PostgreSQL database if they do not already exist."""
     commands = (
@@ -68,24 +93,23 @@ def create_tables():
             zip_code VARCHAR(255),
             occupation VARCHAR(255),
             employer VARCHAR(255),
-            contributor_hash VARCHAR(64) UNIQUE,
-            UNIQUE(name, city, state, zip_code, occupation, employer)
+            contributor_hash BYTEA UNIQUE
         )
         """,
         """
         CREATE TABLE IF NOT EXISTS contributions (
             contribution_id SERIAL PRIMARY KEY,
-            committee_id VARCHAR(255) REFERENCES committees(committee_id),
-            contributor_id INTEGER REFERENCES contributors(contributor_id),
+            committee_id VARCHAR(255) REFERENCES committees(committee_id) DEFERRABLE,
+            contributor_id INTEGER REFERENCES contributors(contributor_id) DEFERRABLE,
             contribution_date DATE,
             contribution_amount NUMERIC(12, 2),
-            contribution_hash VARCHAR(64) UNIQUE
+            contribution_hash BYTEA UNIQUE
         )
         """,
         """
         CREATE TABLE IF NOT EXISTS candidate_committees (
-            candidate_id VARCHAR(255) REFERENCES candidates(candidate_id),
-            committee_id VARCHAR(255) REFERENCES committees(committee_id),
+            candidate_id VARCHAR(255) REFERENCES candidates(candidate_id) DEFERRABLE,
+            committee_id VARCHAR(255) REFERENCES committees(committee_id) DEFERRABLE,
             PRIMARY KEY (candidate_id, committee_id)
         )
         """,
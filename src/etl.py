@@ -1,18 +1,19 @@
+import io
 import os
 import logging
+import re
 import sys
 import hashlib
 import pandas as pd
 from psycopg2 import sql
-from psycopg2.extras import execute_values
 
 # Support running as a package (pytest) or as a script
 try:
-    from src.fec_api import get_candidates, get_committees, get_contributions, create_fec_session
-    from src.db_schema import get_db_connection
+    from src.fec_api import get_candidates, get_committees, iter_contributions, create_fec_session
+    from src.db_schema import get_connection_pool
 except ImportError:
-    from fec_api import get_candidates, get_committees, get_contributions, create_fec_session
-    from db_schema import get_db_connection
+    from fec_api import get_candidates, get_committees, iter_contributions, create_fec_session
+    from db_schema import get_connection_pool
 
 
 import concurrent.futures
@@ -22,183 +23,324 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Configurable worker/chunk sizes (can be overridden via environment variables)
-DEFAULT_CHUNK_SIZE_INSERT = int(os.getenv("ETL_CHUNK_SIZE_INSERT", "1000"))
-DEFAULT_CHUNK_SIZE_UPSERT = int(os.getenv("ETL_CHUNK_SIZE_UPSERT", "500"))
+DEFAULT_MAX_WORKERS = int(os.getenv("ETL_MAX_WORKERS", "8"))
+
+# Contributions buffered in memory before each COPY into the staging table
+DEFAULT_STAGING_BATCH_SIZE = int(os.getenv("ETL_STAGING_BATCH_SIZE", "5000"))
+
+# Per-transaction work_mem for the bulk load
+DEFAULT_WORK_MEM = os.getenv("ETL_WORK_MEM", "256MB")
+
+# Committee IDs requested per /committees/ call; keeps the query string bounded
+COMMITTEE_ID_BATCH_SIZE = 100
+
+_WHITESPACE_RE = re.compile(r"\s+")
 
 
 def _normalize_str(s: str) -> str:
     if s is None:
         return ""
-    return " ".join(str(s).lower().strip().split())
+    return _WHITESPACE_RE.sub(" ", str(s).strip().lower())
 
 
 def _sha256_hex(s: str) -> str:
     return hashlib.sha256(s.encode("utf-8")).hexdigest()
 
 
+# FEC API field -> DataFrame column for each transformed record type
+_CANDIDATE_FIELD_MAP = {
+    'candidate_id': 'candidate_id',
+    'name': 'name',
+    'party': 'party',
+    'state': 'state',
+    'office': 'office',
+    'election_years': 'election_years',
+}
+_COMMITTEE_FIELD_MAP = {
+    'committee_id': 'committee_id',
+    'name': 'name',
+    'city': 'city',
+    'state': 'state',
+    'treasurer_name': 'treasurer_name',
+    'committee_type': 'committee_type',
+}
+_CONTRIBUTION_FIELD_MAP = {
+    'committee_id': 'committee_id',
+    'contributor_name': 'contributor_name',
+    'contributor_city': 'contributor_city',
+    'contributor_state': 'contributor_state',
+    'contributor_zip': 'contributor_zip_code',
+    'contribution_receipt_date': 'contribution_date',
+    'contribution_receipt_amount': 'contribution_amount',
+    'contributor_occupation': 'contributor_occupation',
+    'contributor_employer': 'contributor_employer',
+}
+
+
+def _records_to_df(records: list, field_map: dict) -> pd.DataFrame:
+    """Builds a DataFrame from API records, keeping and renaming the mapped fields."""
+    return pd.DataFrame.from_records(records, columns=list(field_map)).rename(columns=field_map)
+
+
 def transform_candidates_to_df(candidates_data: dict) -> pd.DataFrame:
     """Transforms the raw candidate data into a pandas DataFrame."""
-    transformed_data = []
-    for candidate in candidates_data.get("results", []):
-        transformed_data.append({
-            'candidate_id': candidate.get('candidate_id'),
-            'name': candidate.get('name'),
-            'party': candidate.get('party'),
-            'state': candidate.get('state'),
-            'office': candidate.get('office'),
-            'election_year': candidate.get('election_years', [None])[0]
-        })
-    return pd.DataFrame(transformed_data)
+    df = _records_to_df(candidates_data.get("results", []), _CANDIDATE_FIELD_MAP)
+    df['election_year'] = df.pop('election_years').astype(object).str[0].astype('Int64')
+    return df
 
 def transform_committees_to_df(committees_data: dict) -> pd.DataFrame:
     """Transforms the raw committee data into a pandas DataFrame."""
-    transformed_data = []
-    for committee in committees_data.get("results", []):
-        transformed_data.append({
-            'committee_id': committee.get('committee_id'),
-            'name': committee.get('name'),
-            'city': committee.get('city'),
-            'state': committee.get('state'),
-            'treasurer_name': committee.get('treasurer_name'),
-            'committee_type': committee.get('committee_type')
-        })
-    return pd.DataFrame(transformed_data)
+    return _records_to_df(committees_data.get("results", []), _COMMITTEE_FIELD_MAP)
 
 def transform_contributions_to_df(contributions_data: dict) -> pd.DataFrame:
     """Transforms the raw contribution data into a pandas DataFrame."""
-    transformed_data = []
-    for contribution in contributions_data.get("results", []):
-        transformed_data.append({
-            'committee_id': contribution.get('committee_id'),
-            'contributor_name': contribution.get('contributor_name'),
-            'contributor_city': contribution.get('contributor_city'),
-            'contributor_state': contribution.get('contributor_state'),
-            'contributor_zip_code': contribution.get('contributor_zip'),
-            'contribution_date': contribution.get('contribution_receipt_date'),
-            'contribution_amount': contribution.get('contribution_receipt_amount'),
-            'contributor_occupation': contribution.get('contributor_occupation'),
-            'contributor_employer': contribution.get('contributor_employer')
-        })
-    return pd.DataFrame(transformed_data)
+    df = _records_to_df(contributions_data.get("results", []), _CONTRIBUTION_FIELD_MAP)
+    # Pin the dtype so every batch formats amounts (and so hashes them) the same way
+    df['contribution_amount'] = df['contribution_amount'].astype('float64')
+    return df
+
+def _copy_df(cur, df: pd.DataFrame, table_name: str, schema: str = None):
+    """Streams a DataFrame into a table with COPY FROM STDIN (CSV format)."""
+    buf = io.StringIO()
+    df.to_csv(buf, index=False, header=False, na_rep='\\N')
+    buf.seek(0)
+    query = sql.SQL("COPY {} ({}) FROM STDIN WITH (FORMAT CSV, NULL '\\N')").format(
+        sql.Identifier(schema, table_name) if schema else sql.Identifier(table_name),
+        sql.SQL(', ').join(map(sql.Identifier, df.columns)),
+    )
+    cur.copy_expert(query, buf)
+
+
+# Composed staging/upsert statements, keyed by (table, primary key, columns)
+_QUERIES = {}
+
+
+def _upsert_queries(table_name: str, primary_key: str, columns: tuple):
+    """Returns the (create staging, upsert, drop staging) statements for a table, built once."""
+    key = (table_name, primary_key, columns)
+    queries = _QUERIES.get(key)
+    if queries is None:
+        table = sql.Identifier(table_name)
+        # pg_temp: never resolve to a permanent table of the same name via search_path
+        staging = sql.Identifier("pg_temp", f"stg_{table_name}")
+        cols_sql = sql.SQL(', ').join(sql.Identifier(col) for col in columns)
+        primary_key_identifier = sql.Identifier(primary_key)
+
+        update_clause = sql.SQL(', ').join(
+            sql.SQL("{} = EXCLUDED.{}").format(sql.Identifier(col), sql.Identifier(col))
+            for col in columns if col != primary_key
+        )
+
+        queries = (
+            sql.SQL("CREATE TEMP TABLE {} AS SELECT {} FROM {} WITH NO DATA").format(
+                staging,
+                cols_sql,
+                table,
+            ),
+            # DISTINCT ON: a key repeated in one statement can't be upserted twice
+            sql.SQL("INSERT INTO {} ({}) SELECT DISTINCT ON ({}) {} FROM {} ON CONFLICT ({}) DO UPDATE SET {}").format(
+                table,
+                cols_sql,
+                primary_key_identifier,
+                cols_sql,
+                staging,
+                primary_key_identifier,
+                update_clause,
+            ),
+            sql.SQL("DROP TABLE {}").format(staging),
+        )
+        _QUERIES[key] = queries
+    return queries
+
 
 def load_df_to_db(conn, df: pd.DataFrame, table_name: str, primary_key: str):
-    """Loads a pandas DataFrame into a PostgreSQL table using a provided connection."""
+    """Upserts a pandas DataFrame into a PostgreSQL table using a provided connection.
+
+    Rows are COPYed into a temporary staging table and merged with a single
+    INSERT ... SELECT ... ON CONFLICT DO UPDATE.
+    The caller owns the transaction and is responsible for committing it.
+    """
     if df.empty:
         logger.info("DataFrame for table %s is empty. Nothing to load.", table_name)
         return
 
-    # Insert in chunks to avoid huge payloads
-    tuples = [tuple(x) for x in df.to_numpy()]
-
+    create_staging, upsert, drop_staging = _upsert_queries(table_name, primary_key, tuple(df.columns))
     with conn.cursor() as cur:
-        table = sql.Identifier(table_name)
-        columns = [sql.Identifier(col) for col in df.columns]
-        cols_sql = sql.SQL(', ').join(columns)
+        cur.execute(create_staging)
+        _copy_df(cur, df, f"stg_{table_name}", schema="pg_temp")
+        # Upsert on the primary key so re-runs refresh existing rows
+        cur.execute(upsert)
+        cur.execute(drop_staging)
 
-        if table_name == 'contributions':
-            query = sql.SQL("INSERT INTO {} ({}) VALUES %s ON CONFLICT (contribution_hash) DO NOTHING").format(
-                table,
-                cols_sql,
-            )
-            for i in range(0, len(tuples), DEFAULT_CHUNK_SIZE_INSERT):
-                execute_values(cur, query, tuples[i:i+DEFAULT_CHUNK_SIZE_INSERT])
-        else:
-            # Use primary key upsert for other tables
-            primary_key_identifier = sql.Identifier(primary_key)
-            update_cols = [col for col in df.columns if col != primary_key]
-
-            update_clause = sql.SQL(', ').join(
-                sql.SQL("{} = EXCLUDED.{}").format(sql.Identifier(col), sql.Identifier(col))
-                for col in update_cols
-            )
+        logger.info("%s records loaded into %s.", len(df), table_name)
 
-            query = sql.SQL("INSERT INTO {} ({}) VALUES %s ON CONFLICT ({}) DO UPDATE SET {}").format(
-                table,
-                cols_sql,
-                primary_key_identifier,
-                update_clause,
+def _normalize_series(s: pd.Series) -> pd.Series:
+    """Vectorized equivalent of _normalize_str for a whole column."""
+    # Values such as employer or city repeat heavily, so normalize each distinct value once
+    codes, uniques = pd.factorize(s.astype(object).fillna(''))
+    normalized = (
+        pd.Series(uniques, dtype=object).astype(str)
+        .str.lower()
+        .str.strip()
+        .str.replace(_WHITESPACE_RE, ' ', regex=True)
+    )
+    return pd.Series(normalized.to_numpy(dtype=object)[codes], index=s.index, dtype=object)
+
+
+def _hash_columns(parts: list) -> pd.Series:
+    """Joins the given string columns with '|' and SHA256-hashes each resulting row."""
+    keys = parts[0].str.cat(parts[1:], sep='|')
+    # Hash each distinct key only once; repeat contributors share the digest
+    unique_keys = keys.unique()
+    return keys.map(dict(zip(unique_keys, map(_sha256_hex, unique_keys))))
+
+
+def _get_contributor_hashes(df: pd.DataFrame) -> pd.Series:
+    """Generates SHA256 contributor hashes for every row of a contributions frame."""
+    return _hash_columns([_normalize_series(df[col]) for col in (
+        'contributor_name',
+        'contributor_city',
+        'contributor_state',
+        'contributor_zip_code',
+        'contributor_occupation',
+        'contributor_employer',
+    )])
+
+
+def _get_contribution_hashes(df: pd.DataFrame) -> pd.Series:
+    """Generates SHA256 contribution hashes for every row of a contributions frame."""
+    # Existing keys formatted the amount as str(amount or ''): 0 hashes as '' and NaN as 'nan'
+    amount = pd.Series(
+        [str(v or '') for v in df['contribution_amount'].to_numpy(dtype=object)],
+        index=df.index,
+        dtype=object,
+    )
+    return _hash_columns([
+        df['committee_id'].astype(object).fillna('').astype(str),
+        df['contribution_date'].astype(object).fillna('').astype(str),
+        amount,
+        df['contributor_hash'].astype(object).fillna('').astype(str),
+    ])
+
+
+# Denormalized contribution columns COPYed into the staging table
+_STAGING_CONTRIBUTION_COLUMNS = [
+    'committee_id',
+    'contributor_name',
+    'contributor_city',
+    'contributor_state',
+    'contributor_zip_code',
+    'contributor_occupation',
+    'contributor_employer',
+    'contributor_hash',
+    'contribution_date',
+    'contribution_amount',
+    'contribution_hash',
+]
+
+
+def _iter_batches(pages, batch_size: int):
+    """Regroups an iterable of result pages into lists of at least batch_size records."""
+    pending = []
+    for page in pages:
+        pending.extend(page)
+        if len(pending) >= batch_size:
+            yield pending
+            pending = []
+    if pending:
+        yield pending
+
+
+def create_contributions_staging(conn):
+    """
+    (Re)creates the session-scoped staging table that contribution batches are COPYed into.
+    Temp tables survive commits, so batches can be staged as they are fetched.
+    """
+    with conn.cursor() as cur:
+        # Qualified with pg_temp so a permanent staging_contributions table is never touched
+        cur.execute("DROP TABLE IF EXISTS pg_temp.staging_contributions")
+        cur.execute("""
+            CREATE TEMP TABLE pg_temp.staging_contributions (
+                committee_id VARCHAR(255),
+                contributor_name VARCHAR(255),
+                contributor_city VARCHAR(255),
+                contributor_state VARCHAR(2),
+                contributor_zip_code VARCHAR(255),
+                contributor_occupation VARCHAR(255),
+                contributor_employer VARCHAR(255),
+                contributor_hash BYTEA,
+                contribution_date DATE,
+                contribution_amount NUMERIC(12, 2),
+                contribution_hash BYTEA
             )
-            for i in range(0, len(tuples), DEFAULT_CHUNK_SIZE_UPSERT):
-                execute_values(cur, query, tuples[i:i+DEFAULT_CHUNK_SIZE_UPSERT])
+        """)
 
-        conn.commit()
-        logger.info("%s records loaded into %s.", len(df), table_name)
 
-def _get_contributor_hash(row: pd.Series) -> str:
-    """Generates a SHA256 hash for a contributor row."""
-    parts = [
-        _normalize_str(row.get('contributor_name')),
-        _normalize_str(row.get('contributor_city')),
-        _normalize_str(row.get('contributor_state')),
-        _normalize_str(row.get('contributor_zip_code')),
-        _normalize_str(row.get('contributor_occupation')),
-        _normalize_str(row.get('contributor_employer'))
-    ]
-    return _sha256_hex('|'.join(parts))
-
-
-def _get_contribution_hash(row: pd.Series) -> str:
-    """Generates a SHA256 hash for a contribution row."""
-    parts = [
-        str(row.get('committee_id') or ''),
-        str(row.get('contribution_date') or ''),
-        str(row.get('contribution_amount') or ''),
-        str(row.get('contributor_hash') or '')
-    ]
-    return _sha256_hex('|'.join(parts))
-
-
-def process_and_load_contributors(conn, contributions_df: pd.DataFrame) -> dict:
+def stage_contributions(conn, contributions_df: pd.DataFrame) -> int:
     """
-    Extracts unique contributors, loads them to the DB, and returns a hash-to-ID map.
-    Uses `ON CONFLICT DO UPDATE ... RETURNING contributor_id` for efficiency.
+    Hashes a batch of transformed contributions and COPYs it into the staging table.
+    Returns the number of rows staged.
     """
     if contributions_df.empty:
-        return {}
-
-    logger.info("Processing and loading %d contribution records for contributors.", len(contributions_df))
-    contributors_df = contributions_df[[
-        'contributor_hash', 'contributor_name', 'contributor_city', 'contributor_state',
-        'contributor_zip_code', 'contributor_occupation', 'contributor_employer'
-    ]].drop_duplicates('contributor_hash').rename(columns={
-        'contributor_name': 'name',
-        'contributor_city': 'city',
-        'contributor_state': 'state',
-        'contributor_zip_code': 'zip_code',
-        'contributor_occupation': 'occupation',
-        'contributor_employer': 'employer'
-    })
-
-    tuples = [tuple(x) for x in contributors_df.to_numpy()]
-    if not tuples:
-        return {}
-
+        return 0
+
+    contributions_df = contributions_df.assign(contributor_hash=_get_contributor_hashes(contributions_df))
+    contributions_df['contribution_hash'] = _get_contribution_hashes(contributions_df)
+    # Duplicates across batches are skipped by ON CONFLICT when the staged rows are loaded
+    contributions_df = contributions_df.drop_duplicates('contribution_hash')
+
+    # Hashes are stored as raw 32-byte digests; \x<hex> is bytea's text input format
+    staging_df = contributions_df[_STAGING_CONTRIBUTION_COLUMNS].assign(
+        contributor_hash='\\x' + contributions_df['contributor_hash'],
+        contribution_hash='\\x' + contributions_df['contribution_hash'],
+    )
     with conn.cursor() as cur:
-        cols = list(contributors_df.columns)
-        cols_sql = sql.SQL(', ').join(map(sql.Identifier, cols))
-        
-        # Use ON CONFLICT to update existing records and RETURNING to get IDs back
-        # This avoids a second round-trip to the database.
-        query_str = f"""
-            INSERT INTO contributors ({", ".join(cols)})
-            VALUES %s
-            ON CONFLICT (contributor_hash) DO UPDATE
-            SET name = EXCLUDED.name,
-                city = EXCLUDED.city,
-                state = EXCLUDED.state,
-                zip_code = EXCLUDED.zip_code,
-                occupation = EXCLUDED.occupation,
-                employer = EXCLUDED.employer
-            RETURNING contributor_id, contributor_hash;
-        """
-        
-        # execute_values returns the results from RETURNING
-        results = execute_values(cur, query_str, tuples, fetch=True, page_size=DEFAULT_CHUNK_SIZE_UPSERT)
-        conn.commit()
+        _copy_df(cur, staging_df, 'staging_contributions', schema='pg_temp')
+    return len(staging_df)
+
 
-        contributor_id_map = {r[1]: r[0] for r in results}
-        logger.info("Upserted %d contributors and retrieved their IDs.", len(contributor_id_map))
-        return contributor_id_map
+def load_contributions(conn):
+    """
+    Loads the staged contributions, resolving contributors on the server.
+
+    Contributors and contributions are written with one set-based INSERT ... SELECT each,
+    joined on contributor_hash, and the staging table is dropped afterwards. Contributions
+    to committees that are not in the committees table are skipped.
+    The caller owns the transaction and is responsible for committing it.
+    """
+    with conn.cursor() as cur:
+        # Temp tables are never auto-analyzed; give the planner real row counts for the joins below
+        cur.execute("ANALYZE pg_temp.staging_contributions")
+
+        # Schedule A covers the whole cycle, but only committees linked to the fetched candidates
+        # are loaded; skip contributions to any other committee rather than failing the FK at COMMIT
+        cur.execute("""
+            DELETE FROM pg_temp.staging_contributions s
+            WHERE s.committee_id IS NOT NULL
+              AND NOT EXISTS (SELECT 1 FROM committees m WHERE m.committee_id = s.committee_id)
+        """)
+        if cur.rowcount:
+            logger.warning("Skipped %d contributions to committees that were not loaded.", cur.rowcount)
+
+        cur.execute("""
+            INSERT INTO contributors (name, city, state, zip_code, occupation, employer, contributor_hash)
+            SELECT contributor_name, contributor_city, contributor_state, contributor_zip_code,
+                   contributor_occupation, contributor_employer, contributor_hash
+            FROM pg_temp.staging_contributions
+            ON CONFLICT (contributor_hash) DO NOTHING
+        """)
+        logger.info("%d new contributors loaded.", cur.rowcount)
+
+        cur.execute("""
+            INSERT INTO contributions (committee_id, contributor_id, contribution_date, contribution_amount, contribution_hash)
+            SELECT s.committee_id, c.contributor_id, s.contribution_date, s.contribution_amount, s.contribution_hash
+            FROM pg_temp.staging_contributions s
+            JOIN contributors c USING (contributor_hash)
+            ON CONFLICT (contribution_hash) DO NOTHING
+        """)
+        logger.info("%d new contributions loaded.", cur.rowcount)
+
+        cur.execute("DROP TABLE pg_temp.staging_contributions")
 
 
 def run_etl(api_key: str = None, cycle: int = 2024, office: str = "P"):
@@ -208,67 +350,86 @@ def run_etl(api_key: str = None, cycle: int = 2024, office: str = "P"):
         logger.error("FEC_API_KEY is not set. Please set it in your .env file or pass it as an argument.")
         sys.exit(1)
 
-    fec_session = create_fec_session()
+    # One pooled connection per ETL worker; the shared rate limiter keeps roughly one request
+    # in flight at a time, so nested page fetches don't need connections of their own
+    fec_session = create_fec_session(pool_maxsize=DEFAULT_MAX_WORKERS)
+    db_pool = get_connection_pool()
     db_conn = None
     try:
-        db_conn = get_db_connection()
+        db_conn = db_pool.getconn()
 
         # 1. Fetch Candidates and Committees for the cycle
-        logger.info(f"Fetching candidates and committees for cycle {cycle}, office {office}...")
+        logger.info("Fetching candidates and committees for cycle %s, office %s...", cycle, office)
         candidates_data = get_candidates(fec_session, API_KEY, cycle=cycle, office=office)
         candidates_df = transform_candidates_to_df(candidates_data)
-        if not candidates_df.empty:
-            load_df_to_db(db_conn, candidates_df, 'candidates', 'candidate_id')
 
         # Fetch all committees associated with the candidates
+        # The lookups are independent and I/O bound, so run them concurrently; every request
+        # still passes through fec_api's shared rate limiter, keeping the workers under the FEC cap
         candidate_committee_ids = set()
-        for cand_id in candidates_df['candidate_id'].unique():
-            # This part can be further optimized if there's a bulk endpoint
-            committee_data = get_committees(fec_session, API_KEY, candidate_id=cand_id, cycle=cycle)
-            for committee in committee_data.get("results", []):
-                candidate_committee_ids.add(committee['committee_id'])
+        with concurrent.futures.ThreadPoolExecutor(max_workers=DEFAULT_MAX_WORKERS) as executor:
+            futures = [
+                executor.submit(get_committees, fec_session, API_KEY, candidate_id=cand_id, cycle=cycle)
+                for cand_id in candidates_df['candidate_id'].unique()
+            ]
+            for future in concurrent.futures.as_completed(futures):
+                candidate_committee_ids.update(c['committee_id'] for c in future.result().get("results", []))
         
-        logger.info(f"Found {len(candidate_committee_ids)} unique committees linked to candidates.")
+        logger.info("Found %d unique committees linked to candidates.", len(candidate_committee_ids))
+        committees_df = transform_committees_to_df({})
         if candidate_committee_ids:
-            committees_df = transform_committees_to_df(get_committees(fec_session, API_KEY, committee_id=list(candidate_committee_ids)))
-            if not committees_df.empty:
-                load_df_to_db(db_conn, committees_df, 'committees', 'committee_id')
-
-        # 2. Fetch all contributions for the cycle
-        logger.info(f"Fetching all contributions for cycle {cycle}...")
-        contributions_data = get_contributions(fec_session, API_KEY, cycle=cycle, per_page=100)
-        all_contributions_df = transform_contributions_to_df(contributions_data)
-
-        if all_contributions_df.empty:
-            logger.info("No new contributions found for this cycle. ETL finished.")
-            return
-
-        # 3. Process contributors
-        all_contributions_df['contributor_hash'] = all_contributions_df.apply(_get_contributor_hash, axis=1)
-        contributor_id_map = process_and_load_contributors(db_conn, all_contributions_df)
-
-        # 4. Finalize and load contributions
-        all_contributions_df['contributor_id'] = all_contributions_df['contributor_hash'].map(contributor_id_map)
-        all_contributions_df['contribution_hash'] = all_contributions_df.apply(_get_contribution_hash, axis=1)
-
-        # Drop rows where contributor_id could not be mapped (should be rare)
-        all_contributions_df.dropna(subset=['contributor_id'], inplace=True)
-        all_contributions_df['contributor_id'] = all_contributions_df['contributor_id'].astype(int)
-
-        # Deduplicate contributions by contribution_hash before loading
-        all_contributions_df.drop_duplicates('contribution_hash', inplace=True)
-
-        logger.info("Loading final contributions to the database...")
-        final_contribs_df = all_contributions_df[['committee_id', 'contributor_id', 'contribution_date', 'contribution_amount', 'contribution_hash']].copy()
-        load_df_to_db(db_conn, final_contribs_df, 'contributions', 'contribution_id')
+            committee_ids = sorted(candidate_committee_ids)
+            id_batches = [
+                committee_ids[i:i + COMMITTEE_ID_BATCH_SIZE]
+                for i in range(0, len(committee_ids), COMMITTEE_ID_BATCH_SIZE)
+            ]
+            with concurrent.futures.ThreadPoolExecutor(max_workers=DEFAULT_MAX_WORKERS) as executor:
+                committee_frames = list(executor.map(
+                    lambda ids: transform_committees_to_df(get_committees(fec_session, API_KEY, committee_id=ids)),
+                    id_batches,
+                ))
+            committees_df = pd.concat(committee_frames, ignore_index=True)
+
+        # 2. Stream contributions for the cycle into the staging table, one batch at a time,
+        # so memory stays bounded by the batch size rather than the whole cycle
+        logger.info("Fetching all contributions for cycle %s...", cycle)
+        create_contributions_staging(db_conn)
+        db_conn.commit()
+        staged = 0
+        pages = iter_contributions(fec_session, API_KEY, cycle=cycle, per_page=100)
+        for batch in _iter_batches(pages, DEFAULT_STAGING_BATCH_SIZE):
+            staged += stage_contributions(db_conn, transform_contributions_to_df({"results": batch}))
+            db_conn.commit()
+        logger.info("Staged %d contributions.", staged)
+
+        # 3. Load everything in a single transaction, once all API calls are done, so the
+        # transaction is never held open across network fetches and commits only once.
+        # Staging commits above only touch the session's temp table.
+        with db_conn.cursor() as cur:
+            # Foreign keys are checked once at COMMIT instead of after every statement
+            cur.execute("SET CONSTRAINTS ALL DEFERRED")
+            # The load is idempotent and can simply be re-run after a crash, so don't wait on the WAL flush
+            cur.execute("SET LOCAL synchronous_commit = off")
+            # Room for the staging joins to hash in memory instead of spilling to disk
+            cur.execute("SET LOCAL work_mem = %s", (DEFAULT_WORK_MEM,))
+
+        load_df_to_db(db_conn, candidates_df, 'candidates', 'candidate_id')
+        load_df_to_db(db_conn, committees_df, 'committees', 'committee_id')
+
+        load_contributions(db_conn)
+
+        db_conn.commit()
+        logger.info("ETL finished; all changes committed.")
 
     except Exception:
         logger.exception("An error occurred during the ETL process")
+        if db_conn:
+            db_conn.rollback()
         raise
     finally:
         if db_conn:
-            db_conn.close()
-            logger.info("Database connection closed.")
+            db_pool.putconn(db_conn)
+            logger.info("Database connection returned to the pool.")
         fec_session.close()
 
 
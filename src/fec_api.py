@@ -6,15 +6,58 @@ from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 import time
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:  # optional, faster JSON decoding
+    orjson = None
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 API_KEY = os.getenv("FEC_API_KEY")
 BASE_URL = "https://api.open.fec.gov/v1"
 
-def create_fec_session():
+# Concurrent requests used for the remaining pages of page-numbered endpoints
+PAGE_FETCH_WORKERS = 4
+
+# The FEC API asks to not hit it more than once a second
+MIN_REQUEST_INTERVAL = 1.0
+
+
+class RateLimiter:
+    """
+    Spaces requests at least `interval` seconds apart across every thread sharing it.
+
+    Each caller reserves the next free slot under the lock and sleeps outside it, so
+    time already spent waiting on a response counts towards the interval.
+    """
+
+    def __init__(self, interval):
+        self._interval = interval
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            wait = max(0.0, self._next - now)
+            self._next = max(now, self._next) + self._interval
+        if wait:
+            time.sleep(wait)
+
+
+_rate_limiter = RateLimiter(MIN_REQUEST_INTERVAL)
+
+def create_fec_session(pool_maxsize=10):
     """
     Creates a requests.Session with automatic retries.
+
+    pool_maxsize should be at least the number of threads sharing the session, so
+    every worker can keep its own connection alive instead of re-handshaking.
     """
     session = requests.Session()
     retry = Retry(
@@ -22,51 +65,84 @@ def create_fec_session():
         read=3,
         connect=3,
         backoff_factor=0.3,
-        status_forcelist=(500, 502, 504),
+        # Retries are resent inside session.get and so bypass _rate_limiter; keep them few, and
+        # let 429/503 wait out the server's Retry-After header before trying again
+        status_forcelist=(429, 500, 502, 503, 504),
+        respect_retry_after_header=True,
     )
-    adapter = HTTPAdapter(max_retries=retry)
+    adapter = HTTPAdapter(max_retries=retry, pool_connections=pool_maxsize, pool_maxsize=pool_maxsize)
     session.mount("http://", adapter)
     session.mount("https://", adapter)
     return session
 
-def _fetch_all_pages(session, url, params):
+def _get_page(session, url, params):
     """
-    Fetches all pages of results from a given FEC API endpoint.
+    Fetches and decodes a single page from a given FEC API endpoint.
+    """
+    _rate_limiter.acquire()
+    try:
+        response = session.get(url, params=params)
+        response.raise_for_status()  # Raise an exception for bad status codes
+        if orjson is not None:
+            return orjson.loads(response.content)
+        return response.json()
+    except requests.exceptions.RequestException as e:
+        logger.error("Error during API request: %s", e)
+        raise e
+    except Exception as e:
+        logger.error("An unexpected error occurred: %s", e)
+        raise e
+
+
+def _iter_pages(session, url, params):
+    """
+    Yields the results of each page from a given FEC API endpoint, one page at a time.
     """
-    all_results = []
     params['page'] = 1
     params['per_page'] = 100
 
-    logging.info(f"Fetching from {url} with initial params: { {k: v for k, v in params.items() if k != 'api_key'} }")
+    # Runs once per lookup from many worker threads, so only build the message when it will be emitted
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Fetching from %s with initial params: %s", url, {k: v for k, v in params.items() if k != 'api_key'})
+    data = _get_page(session, url, params)
+    yield data.get("results", [])
+
+    pagination = data.get("pagination", {})
+    if "last_indexes" not in pagination:
+        # Page-numbered endpoints (candidates, committees): once the page count is known the
+        # remaining pages are independent, so fetch them concurrently, in order.
+        def fetch(page):
+            page_data = _get_page(session, url, {**params, 'page': page})
+            return page_data.get("results", [])
+
+        pages = pagination.get("pages") or 1
+        with ThreadPoolExecutor(max_workers=PAGE_FETCH_WORKERS) as executor:
+            yield from executor.map(fetch, range(2, pages + 1))
+        return
+
+    # Cursor-paginated endpoints (Schedule A): each request needs the previous page's last_indexes
     while True:
-        try:
-            response = session.get(url, params=params)
-            response.raise_for_status()  # Raise an exception for bad status codes
-            data = response.json()
-            
-            all_results.extend(data.get("results", []))
-            
-            pagination = data.get("pagination", {})
-            last_indexes = pagination.get("last_indexes")
-            
-            if not last_indexes or pagination.get("page") >= pagination.get("pages"):
-                break
-                
-            params['last_index'] = last_indexes.get('last_index')
-            # The FEC API documentation specifies that for Schedule A, both last_index and last_contribution_receipt_date might be needed.
-            if 'last_contribution_receipt_date' in last_indexes:
-                params['last_contribution_receipt_date'] = last_indexes.get('last_contribution_receipt_date')
-
-            # The FEC API asks to not hit it more than once a second
-            time.sleep(1)
-
-        except requests.exceptions.RequestException as e:
-            logging.error(f"Error during API request: {e}")
-            raise e
-        except Exception as e:
-            logging.error(f"An unexpected error occurred: {e}")
-            raise e
+        last_indexes = pagination.get("last_indexes")
+        if not last_indexes or pagination.get("page") >= pagination.get("pages"):
+            break
+
+        params['last_index'] = last_indexes.get('last_index')
+        # The FEC API documentation specifies that for Schedule A, both last_index and last_contribution_receipt_date might be needed.
+        if 'last_contribution_receipt_date' in last_indexes:
+            params['last_contribution_receipt_date'] = last_indexes.get('last_contribution_receipt_date')
+
+        data = _get_page(session, url, params)
+        yield data.get("results", [])
+        pagination = data.get("pagination", {})
+
 
+def _fetch_all_pages(session, url, params):
+    """
+    Fetches all pages of results from a given FEC API endpoint.
+    """
+    all_results = []
+    for results in _iter_pages(session, url, params):
+        all_results.extend(results)
     return {"results": all_results}
 
 
@@ -103,6 +179,18 @@ def get_contributions(session, api_key, **kwargs):
     url = f"{BASE_URL}/schedules/schedule_a/"
     return _fetch_all_pages(session, url, params)
 
+def iter_contributions(session, api_key, **kwargs):
+    """
+    Yields contributions from the FEC API one page at a time, so callers can
+    process them without holding the whole result set in memory.
+    """
+    if not api_key:
+        raise ValueError("FEC_API_KEY is not set. Please set it in your .env file.")
+
+    params = {"api_key": api_key, **kwargs}
+    url = f"{BASE_URL}/schedules/schedule_a/"
+    return _iter_pages(session, url, params)
+
 if __name__ == "__main__":
     if not API_KEY:
         raise ValueError("FEC_API_KEY is not set. Please set it in your .env file.")
@@ -0,0 +1,107 @@
+import json
+import threading
+import time
+
+import pytest
+
+import src.fec_api as fec_api
+from src.fec_api import RateLimiter, _fetch_all_pages
+
+
+class FakeResponse:
+    def __init__(self, data):
+        self.data = data
+        self.content = json.dumps(data).encode()
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.data
+
+
+class FakeSession:
+    """Serves canned pages and records the params of every request."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.calls = []
+
+    def get(self, url, params):
+        self.calls.append(dict(params))
+        page = params['page'] if 'last_index' not in params else params['last_index'] + 1
+        # Later pages answer first, so out-of-order completion would show up in the results
+        time.sleep(0.01 * (len(self.pages) - page))
+        return FakeResponse(self.pages[page - 1])
+
+
+class CountingLimiter:
+    def __init__(self):
+        self.acquired = 0
+
+    def acquire(self):
+        self.acquired += 1
+
+
+def test_fetch_all_pages_fetches_every_numbered_page_in_order(monkeypatch):
+    limiter = CountingLimiter()
+    monkeypatch.setattr(fec_api, '_rate_limiter', limiter)
+    pages = [{'results': [n], 'pagination': {'page': n, 'pages': 5}} for n in range(1, 6)]
+    session = FakeSession(pages)
+
+    assert _fetch_all_pages(session, 'url', {}) == {'results': [1, 2, 3, 4, 5]}
+    assert sorted(call['page'] for call in session.calls) == [1, 2, 3, 4, 5]
+    # Every request, including the concurrent ones, goes through the shared limiter
+    assert limiter.acquired == 5
+
+
+def test_fetch_all_pages_follows_last_index_cursor(monkeypatch):
+    monkeypatch.setattr(fec_api, '_rate_limiter', CountingLimiter())
+    pages = [
+        {'results': ['a'], 'pagination': {'page': 1, 'pages': 3, 'last_indexes': {'last_index': 1, 'last_contribution_receipt_date': '2024-01-01'}}},
+        {'results': ['b'], 'pagination': {'page': 2, 'pages': 3, 'last_indexes': {'last_index': 2, 'last_contribution_receipt_date': '2024-01-02'}}},
+        {'results': ['c'], 'pagination': {'page': 3, 'pages': 3, 'last_indexes': {'last_index': 3}}},
+    ]
+    session = FakeSession(pages)
+
+    assert _fetch_all_pages(session, 'url', {}) == {'results': ['a', 'b', 'c']}
+    assert [call.get('last_index') for call in session.calls] == [None, 1, 2]
+    assert session.calls[2]['last_contribution_receipt_date'] == '2024-01-02'
+
+
+def test_rate_limiter_spaces_requests_on_a_fake_clock(monkeypatch):
+    now = [100.0]
+    sleeps = []
+
+    def fake_sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    monkeypatch.setattr(fec_api.time, 'monotonic', lambda: now[0])
+    monkeypatch.setattr(fec_api.time, 'sleep', fake_sleep)
+    limiter = RateLimiter(1.0)
+
+    limiter.acquire()
+    now[0] += 0.4  # the request took 400ms
+    limiter.acquire()
+    now[0] += 2.0  # idle for longer than the interval
+    limiter.acquire()
+    assert sleeps == [pytest.approx(0.6)]
+
+
+def test_rate_limiter_spaces_requests_across_threads():
+    limiter = RateLimiter(0.05)
+    times = []
+
+    def worker():
+        limiter.acquire()
+        times.append(time.monotonic())
+
+    threads = [threading.Thread(target=worker) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    times.sort()
+    assert all(later - earlier >= 0.045 for earlier, later in zip(times, times[1:]))